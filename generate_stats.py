@@ -1,27 +1,210 @@
 import os
-import re
-import json
+import time
+import hashlib
+import orjson
 import requests
-from typing import Dict, List, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime, timezone, timedelta
 from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+
+MONTHS = ("January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December")
+
+# Calendar cell colors for 0, 1-3, 4-6, 7-9 and 10+ contributions
+COLORS = ("#ebedf0", "#9be9a8", "#40c463", "#30a14e", "#216e39")
+
+REPO_FIELDS = """
+      nodes {
+        stargazerCount
+        forkCount
+        watchers { totalCount }
+        licenseInfo { key }
+        releases { totalCount }
+        packages { totalCount }
+        diskUsage
+      }
+      pageInfo { hasNextPage endCursor }"""
+
+# Most of the SVG in one round trip, the repos are fetched alongside it
+STATS_QUERY = """
+query($from: DateTime!, $to: DateTime!, $commented: String!) {
+  viewer {
+    name
+    createdAt
+    isHireable
+    followers { totalCount }
+    following { totalCount }
+    organizations { totalCount }
+    starredRepositories { totalCount }
+    watching { totalCount }
+    issues(states: OPEN) { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    contributionsCollection(from: $from, to: $to) {
+      totalCommitContributions
+      totalPullRequestContributions
+      totalPullRequestReviewContributions
+      contributionCalendar {
+        weeks { contributionDays { date contributionCount } }
+      }
+    }
+  }
+  commented: search(query: $commented, type: ISSUE) { issueCount }
+}
+"""
+
+# A null cursor fetches the first page
+REPOS_QUERY = """
+query($cursor: String, $first: Int!) {
+  viewer {
+    repositories(first: $first, after: $cursor, ownerAffiliations: OWNER) {""" + REPO_FIELDS + """
+    }
+  }
+}
+"""
+
+# GraphQL's largest page, so the repo listing takes as few round trips as possible
+REPOS_PER_PAGE = 100
+
+# Connections kept open to api.github.com, one each for the stats query and the repo pages
+POOL_SIZE = 2
+
+# Transient failures are retried with backoff, Retry-After on 429 is honoured.
+# POST is included because the GraphQL queries here only read.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+    raise_on_status=False
+)
+
+# Max-age for cached responses, served without a request while fresh
+PROFILE_TTL = 60 * 60
+STATS_TTL = 30 * 60
+
+SVG_OPEN = '<svg width="900" height="450" xmlns="http://www.w3.org/2000/svg">\n'
+SVG_BACKGROUND = '  \n  <rect width="900" height="450" fill="#0d1117"/>\n  \n'
+DEFS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "defs.svg")
+
+# One stat line in the four lower columns, only the slots change between rows
+ROW_TMPL = ('\n    <use href="#{icon}" x="{x}" y="{y}"/>'
+            '\n    <text x="{text_x}" y="{text_y}">{label}: {value}</text>')
+# Text styling shared by every row of a column, set once on the group instead of per <text>
+ROW_GROUP_OPEN = '\n  <g font-family="Arial" font-size="13" fill="#c9d1d9">'
+ROW_GROUP_CLOSE = '\n  </g>'
+
+# Profile detail lines under the name, a size up from the stat rows
+PROFILE_ROW_TMPL = ('\n    <use href="#{icon}" x="20" y="{y}"/>'
+                    '\n    <text x="42" y="{text_y}">{label}: {value}</text>')
+PROFILE_GROUP_OPEN = '\n  <g font-family="Arial" font-size="14" fill="#c9d1d9">'
+
+# Title above each stat column
+HEADER_TMPL = '\n  <text x="{x}" y="190" font-family="Arial" font-size="16" font-weight="bold" fill="#c9d1d9">{title}</text>'
+
+# One calendar day, the square and its weekday label
+CELL_TMPL = ('  <rect x="{x}" y="60" width="35" height="35" fill="{color}" rx="3"/>\n'
+             '  <text x="{text_x}" y="115" font-family="Arial" font-size="10" fill="#8b949e" text-anchor="middle">{day}</text>\n')
+
+COLUMN_BREAK = "\n  \n"
+
+# Icon <defs> id for each stat, keyed like the config toggles
+ICONS = {
+    "commits": "git-commit-icon",
+    "pr_reviews": "eye-icon",
+    "prs_opened": "git-pr-icon",
+    "issues_open": "alert-icon",
+    "issue_comments": "message-icon",
+    "organizations": "building-icon",
+    "following": "user-plus-icon",
+    "starred": "star-outline-icon",
+    "watching": "eye-icon",
+    "total_repos": "folder-icon",
+    "license": "scale-icon",
+    "releases": "rocket-icon",
+    "packages": "package-icon",
+    "disk_usage": "database-icon",
+    "stargazers": "star-icon",
+    "forkers": "fork-icon",
+    "watchers": "eye-icon"
+}
+
+
+@lru_cache(maxsize=None)
+def _svg_defs() -> str:
+    # Icon <defs> shared by every render, read from disk once
+    with open(DEFS_PATH, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _renderer_digest() -> bytes:
+    # Changes whenever this script or the icon defs change, so cached SVGs from older versions are not reused
+    with open(os.path.abspath(__file__), 'rb') as f:
+        source = f.read()
+    return hashlib.blake2b(source + _svg_defs().encode(), digest_size=16).digest()
+
+
+@lru_cache(maxsize=32)
+def _stat_rows(x: int, rows: Tuple[Tuple[bool, str, str, Any], ...]) -> str:
+    # (show, key, label, value) rows stacked 25px apart from y=210, hidden rows leave no gap.
+    # Rows are plain scalars, so an unchanged column is served from the cache.
+    lines = [ROW_GROUP_OPEN]
+    y_pos = 210
+    for show, key, label, value in rows:
+        if show:
+            lines.append(ROW_TMPL.format(icon=ICONS[key], x=x, y=y_pos, text_x=x + 18, text_y=y_pos + 10, label=label, value=value))
+            y_pos += 25
+    if len(lines) == 1:
+        return ""
+    lines.append(ROW_GROUP_CLOSE)
+    return "".join(lines)
+
+
+def _fmt_num(n: float) -> str:
+    # At most two decimals, trailing zeros dropped: 20.0 -> "20", 1.5 -> "1.5"
+    return f"{n:.2f}".rstrip("0").rstrip(".")
+
+
+def _format_github_date(timestamp: str) -> str:
+    # "2015-03-07T10:20:30Z" -> "March 07, 2015", sliced since GitHub timestamps have a fixed shape
+    return f"{MONTHS[int(timestamp[5:7]) - 1]} {timestamp[8:10]}, {timestamp[:4]}"
+
+
+def _last_7_days(now: datetime) -> List[Tuple[str, str]]:
+    # (date, weekday) pairs, oldest first
+    return [(d.isoformat()[:10], d.strftime("%a")) for d in (now - timedelta(days=i) for i in range(6, -1, -1))]
 
 
 class GitHubStatsGenerator:
-    def __init__(self, token: str, config_path: str = "config.json"):
+    def __init__(self, token: str, config_path: str = "config.json", cache_dir: str = ".stats_cache"):
         self.token = token
         self.headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28"
         }
         self.base_url = "https://api.github.com"
+        self.cache_dir = cache_dir
+        # Last X-RateLimit-Remaining seen per resource ("core", "graphql", ...)
+        self.rate_limit_remaining: Dict[str, int] = {}
+        # One pooled session so all requests reuse the same TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY))
         self.username = self._get_authenticated_user()
         self.config = self._load_config(config_path)
     
     def _load_config(self, config_path: str) -> Dict:
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return orjson.loads(f.read())
         return self._default_config()
     
     def _default_config(self) -> Dict:
@@ -34,162 +217,166 @@ class GitHubStatsGenerator:
             'metadata': {'stargazers': True, 'forkers': True, 'watchers': True}
         }
     
-    def _get_authenticated_user(self) -> str:
-        response = requests.get(f"{self.base_url}/user", headers=self.headers)
-        response.raise_for_status()
-        return response.json()["login"]
+    def _json(self, response: requests.Response) -> Any:
+        return orjson.loads(response.content)
     
-    def get_user_profile(self) -> Dict[str, Any]:
-        # Fetch user profile
-        response = requests.get(f"{self.base_url}/users/{self.username}", headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+    def _cache_path(self, key: str) -> str:
+        # The token is part of the key, a TTL hit sends no request so GitHub never gets to check who is asking
+        digest = hashlib.sha256((self.token + "\0" + key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".entry")
     
-    def get_user_repos(self) -> List[Dict[str, Any]]:
-        # Get all repos
-        repos = []
-        page = 1
-        while True:
-            response = requests.get(
-                f"{self.base_url}/user/repos",
-                headers=self.headers,
-                params={"per_page": 100, "page": page, "affiliation": "owner"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            if not data:
-                break
-            repos.extend(data)
-            page += 1
-        return repos
+    def _read_cache(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        # A JSON metadata line followed by the response body exactly as GitHub sent it
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, 'rb') as f:
+            entry = orjson.loads(f.readline())
+            entry["content"] = f.read()
+        return entry
     
-    def get_user_events(self, days: int = 7) -> List[Dict[str, Any]]:
-        # Get recent events
-        events = []
-        page = 1
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        
-        while page <= 10:
-            response = requests.get(
-                f"{self.base_url}/users/{self.username}/events",
-                headers=self.headers,
-                params={"per_page": 100, "page": page}
-            )
-            response.raise_for_status()
-            data = response.json()
-            if not data:
-                break
-            
-            for event in data:
-                event_date = datetime.strptime(event["created_at"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-                if event_date < cutoff_date:
-                    return events
-                events.append(event)
-            page += 1
-        
-        return events
+    def _write_cache(self, cache_path: str, content: bytes, etag: Optional[str] = None):
+        # Written to a temp file first so an interrupted run never leaves a torn entry
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({"etag": etag, "fetched_at": time.time()}))
+            f.write(b"\n")
+            f.write(content)
+        os.replace(tmp_path, cache_path)
     
-    def get_organizations(self) -> List[Dict[str, Any]]:
-        # Get orgs
-        response = requests.get(f"{self.base_url}/user/orgs", headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+    def _is_fresh(self, cached: Optional[Dict[str, Any]], ttl: int) -> bool:
+        return cached is not None and time.time() - cached.get("fetched_at", 0) < ttl
     
-    def get_starred_count(self) -> int:
-        # Count starred repos
-        response = requests.get(
-            f"{self.base_url}/users/{self.username}/starred",
-            headers=self.headers,
-            params={"per_page": 1}
-        )
-        response.raise_for_status()
-        link_header = response.headers.get("Link", "")
-        if "last" in link_header:
-            match = re.search(r'page=(\d+)>; rel="last"', link_header)
-            if match:
-                return int(match.group(1))
-        return len(response.json())
+    def _note_rate_limit(self, response: requests.Response):
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            resource = response.headers.get("X-RateLimit-Resource", "core")
+            self.rate_limit_remaining[resource] = int(remaining)
     
-    def get_watching_count(self) -> int:
-        # Count watched repos
-        response = requests.get(
-            f"{self.base_url}/users/{self.username}/subscriptions",
-            headers=self.headers,
-            params={"per_page": 1}
-        )
-        response.raise_for_status()
-        link_header = response.headers.get("Link", "")
-        if "last" in link_header:
-            match = re.search(r'page=(\d+)>; rel="last"', link_header)
-            if match:
-                return int(match.group(1))
-        return len(response.json())
+    def _rate_limited(self, resource: str, cached: Optional[Dict[str, Any]], response: Optional[requests.Response] = None) -> bool:
+        # With the budget exhausted, a stale cached body beats a request that would fail.
+        # Before a request only the count seen earlier this run is known, after one GitHub's answer decides.
+        if cached is None:
+            return False
+        if response is None:
+            exhausted = self.rate_limit_remaining.get(resource) == 0
+        else:
+            exhausted = response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0"
+        if exhausted:
+            print(f"Warning: {resource} rate limit exhausted, using cached data")
+        return exhausted
     
-    def get_issues_stats(self) -> Tuple[int, int]:
-        # Get issues stats
-        issues_response = requests.get(
-            f"{self.base_url}/search/issues",
-            headers=self.headers,
-            params={"q": f"author:{self.username} type:issue is:open", "per_page": 1}
-        )
-        issues_response.raise_for_status()
-        open_issues = issues_response.json().get("total_count", 0)
-        
-        comments_response = requests.get(
-            f"{self.base_url}/search/issues",
-            headers=self.headers,
-            params={"q": f"commenter:{self.username}", "per_page": 1}
-        )
-        comments_response.raise_for_status()
-        comments = comments_response.json().get("total_count", 0)
+    def _conditional_get(self, url: str, params: Optional[Dict[str, Any]] = None, ttl: int = 0) -> Any:
+        # GET with If-None-Match, a 304 is answered from the on-disk cache
+        key = url
+        if params:
+            key += "?" + urlencode(sorted(params.items()))
+        cache_path = self._cache_path(key)
+        cached = self._read_cache(cache_path)
+        if self._is_fresh(cached, ttl) or self._rate_limited("core", cached):
+            return orjson.loads(cached["content"])
+        
+        headers = None
+        if cached and cached.get("etag"):
+            headers = {"If-None-Match": cached["etag"]}
+        
+        response = self.session.get(url, headers=headers, params=params)
+        self._note_rate_limit(response)
+        if self._rate_limited("core", cached, response):
+            return orjson.loads(cached["content"])
+        if cached and response.status_code == 304:
+            self._write_cache(cache_path, cached["content"], cached["etag"])
+            return orjson.loads(cached["content"])
+        response.raise_for_status()
         
-        return open_issues, comments
+        data = self._json(response)
+        if ttl or response.headers.get("ETag"):
+            self._write_cache(cache_path, response.content, response.headers.get("ETag"))
+        return data
     
-    def get_contributed_repos(self) -> int:
-        # Count contributed repos
-        response = requests.get(
-            f"{self.base_url}/search/commits",
-            headers=self.headers,
-            params={"q": f"author:{self.username}", "per_page": 1}
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None, ttl: int = 0) -> Dict[str, Any]:
+        # GraphQL POSTs carry no ETag, so results are cached for ttl seconds instead
+        variables = variables or {}
+        cache_path = self._cache_path(query + orjson.dumps(variables, option=orjson.OPT_SORT_KEYS).decode())
+        cached = self._read_cache(cache_path) if ttl else None
+        if self._is_fresh(cached, ttl) or self._rate_limited("graphql", cached):
+            return orjson.loads(cached["content"])["data"]
+        
+        response = self.session.post(
+            f"{self.base_url}/graphql",
+            json={"query": query, "variables": variables}
         )
+        self._note_rate_limit(response)
+        if self._rate_limited("graphql", cached, response):
+            return orjson.loads(cached["content"])["data"]
         response.raise_for_status()
-        return response.json().get("total_count", 0)
+        payload = self._json(response)
+        # GraphQL can also report an exhausted budget as a RATE_LIMITED error on a 200
+        if cached and any(e.get("type") == "RATE_LIMITED" for e in payload.get("errors", ())):
+            print("Warning: graphql rate limit exhausted, using cached data")
+            return orjson.loads(cached["content"])["data"]
+        errors = payload.get("errors")
+        if errors:
+            # Fields the token lacks scopes for (packages needs read:packages) come back as null, the rest is still good
+            if payload.get("data") is None or any(e.get("type") != "INSUFFICIENT_SCOPES" for e in errors):
+                raise RuntimeError(f"GraphQL query failed: {errors[0]['message']}")
+            print(f"Warning: {errors[0]['message']}")
+        
+        if ttl:
+            self._write_cache(cache_path, response.content)
+        return payload["data"]
     
-    def get_gists_count(self) -> int:
-        # Count gists
-        response = requests.get(
-            f"{self.base_url}/users/{self.username}/gists",
-            headers=self.headers,
-            params={"per_page": 1}
-        )
-        response.raise_for_status()
-        link_header = response.headers.get("Link", "")
-        if "last" in link_header:
-            match = re.search(r'page=(\d+)>; rel="last"', link_header)
-            if match:
-                return int(match.group(1))
-        return len(response.json())
+    def _get_authenticated_user(self) -> str:
+        return self._conditional_get(f"{self.base_url}/user", ttl=PROFILE_TTL)["login"]
+    
+    def get_repos(self) -> List[Dict[str, Any]]:
+        # Owned repositories, paged by cursor until GitHub reports no next page
+        repos = []
+        cursor = None
+        while True:
+            variables = {"cursor": cursor, "first": REPOS_PER_PAGE}
+            page = self._graphql(REPOS_QUERY, variables, ttl=STATS_TTL)["viewer"]["repositories"]
+            repos.extend(page["nodes"])
+            if not page["pageInfo"]["hasNextPage"]:
+                return repos
+            cursor = page["pageInfo"]["endCursor"]
+    
+    def get_viewer_stats(self, start: datetime, end: datetime) -> Dict[str, Any]:
+        # The stats query and the repo pages don't depend on each other, so run them side by side
+        variables = {
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "commented": f"commenter:{self.username}"
+        }
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            stats_future = pool.submit(self._graphql, STATS_QUERY, variables, STATS_TTL)
+            repos_future = pool.submit(self.get_repos)
+            data = stats_future.result()
+            repos = repos_future.result()
+        
+        viewer = data["viewer"]
+        viewer["commented"] = data["commented"]
+        viewer["repositories"] = repos
+        return viewer
     
     def analyze_repos(self, repos: List[Dict[str, Any]]) -> Dict[str, Any]:
-        # Analyze repos
-        licenses = [r.get("license", {}).get("key") for r in repos if r.get("license")]
-        most_common_license = Counter(licenses).most_common(1)[0][0] if licenses else "None"
-        
-        total_stars = sum(r.get("stargazers_count", 0) for r in repos)
-        total_forks = sum(r.get("forks_count", 0) for r in repos)
-        total_watchers = sum(r.get("watchers_count", 0) for r in repos)
-        total_size = sum(r.get("size", 0) for r in repos)
-        
-        releases_count = 0
-        packages_count = 0
-        
-        for repo in repos[:10]:
-            try:
-                rel_response = requests.get(repo["releases_url"].replace("{/id}", ""), headers=self.headers, timeout=2)
-                if rel_response.status_code == 200:
-                    releases_count += len(rel_response.json())
-            except:
-                pass
+        # Analyze repository nodes in one pass, the getter is bound once for the whole loop
+        get = itemgetter("stargazerCount", "forkCount", "watchers", "releases", "packages", "diskUsage", "licenseInfo")
+        licenses = Counter()
+        total_stars = total_forks = total_watchers = total_size = 0
+        releases_count = packages_count = 0
+        for stars, forks, watchers, releases, packages, disk_usage, license_info in map(get, repos):
+            if license_info:
+                licenses[license_info["key"]] += 1
+            total_stars += stars
+            total_forks += forks
+            total_watchers += watchers["totalCount"]
+            total_size += disk_usage or 0
+            releases_count += releases["totalCount"]
+            # Null when the token lacks read:packages
+            if packages:
+                packages_count += packages["totalCount"]
+        most_common_license = licenses.most_common(1)[0][0] if licenses else "None"
         
         return {
             "license": most_common_license,
@@ -201,53 +388,25 @@ class GitHubStatsGenerator:
             "total_watchers": total_watchers
         }
     
-    def analyze_events(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
-        # Analyze activity
-        commits = sum(1 for e in events if e["type"] == "PushEvent")
-        prs_opened = sum(1 for e in events if e["type"] == "PullRequestEvent" and e.get("payload", {}).get("action") == "opened")
-        pr_reviews = sum(1 for e in events if e["type"] == "PullRequestReviewEvent")
-        
-        daily_contributions = {}
-        for event in events:
-            date = event["created_at"][:10]
-            daily_contributions[date] = daily_contributions.get(date, 0) + 1
+    def analyze_contributions(self, contributions: Dict[str, Any], dates: List[str]) -> Dict[str, Any]:
+        # Analyze activity, one pass keys the calendar by date and the 7 days are read back in order
+        counts = {
+            day["date"]: day["contributionCount"]
+            for week in contributions["contributionCalendar"]["weeks"]
+            for day in week["contributionDays"]
+        }
+        daily_contributions = [counts.get(date, 0) for date in dates]
         
         return {
-            "commits": commits,
-            "prs_opened": prs_opened,
-            "pr_reviews": pr_reviews,
+            "commits": contributions["totalCommitContributions"],
+            "prs_opened": contributions["totalPullRequestContributions"],
+            "pr_reviews": contributions["totalPullRequestReviewContributions"],
             "daily_contributions": daily_contributions
         }
     
-    def generate_contribution_calendar(self, daily_contributions: Dict[str, int]) -> str:
-        # Build calendar
-        today = datetime.now(timezone.utc)
-        calendar = "<table><tr>"
-        
-        for i in range(6, -1, -1):
-            date = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-            count = daily_contributions.get(date, 0)
-            
-            if count == 0:
-                color = "#ebedf0"
-            elif count <= 3:
-                color = "#9be9a8"
-            elif count <= 6:
-                color = "#40c463"
-            elif count <= 9:
-                color = "#30a14e"
-            else:
-                color = "#216e39"
-            
-            day_name = (today - timedelta(days=i)).strftime("%a")
-            calendar += f"<td align='center' style='padding: 5px;'><div style='background-color: {color}; width: 30px; height: 30px; border-radius: 3px;'></div><small>{day_name}</small></td>"
-        
-        calendar += "</tr></table>"
-        return calendar
-    
-    def generate_contribution_summary(self, daily_contributions: Dict[str, int]) -> str:
+    def generate_contribution_summary(self, daily_contributions: List[int]) -> str:
         # Summarize contributions
-        total = sum(daily_contributions.values())
+        total = sum(daily_contributions)
         if total == 0:
             return "No contributions in the last 7 days"
         elif total <= 5:
@@ -258,14 +417,56 @@ class GitHubStatsGenerator:
             return f"{total} contributions - High activity this week"
     
     def generate_profile_section(self, profile: Dict[str, Any], stats: Dict[str, Any]) -> str:
+        # The SVG only depends on these inputs, reuse the last render when none of them changed
+        key = hashlib.blake2b(
+            _renderer_digest() + orjson.dumps((self.username, profile, stats, self.config)),
+            digest_size=16
+        ).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"svg_{key}.svg")
+        if os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding="utf-8") as f:
+                return f.read()
+        
+        svg_content = self._render_profile_section(profile, stats)
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for entry in os.listdir(self.cache_dir):
+            if entry.startswith("svg_") and entry.endswith(".svg"):
+                os.remove(os.path.join(self.cache_dir, entry))
+        with open(cache_path, 'w', encoding="utf-8") as f:
+            f.write(svg_content)
+        return svg_content
+    
+    def _render_profile_section(self, profile: Dict[str, Any], stats: Dict[str, Any]) -> str:
         # Build SVG
         name = profile.get("name", self.username)
         hireable = profile.get("hireable", False)
-        created_at = datetime.strptime(profile["created_at"], "%Y-%m-%dT%H:%M:%SZ").strftime("%B %d, %Y")
+        created_at = _format_github_date(profile["created_at"])
         followers = profile.get("followers", 0)
         following = profile.get("following", 0)
         public_repos = profile.get("public_repos", 0)
         
+        # Unpack the stats once so the template below reads plain locals
+        activity = stats['activity']
+        commits = activity['commits']
+        pr_reviews = activity['pr_reviews']
+        prs_opened = activity['prs_opened']
+        open_issues = stats['issues']['open']
+        issue_comments = stats['issues']['comments']
+        community = stats['community']
+        orgs = community['orgs']
+        starred = community['starred']
+        watching = community['watching']
+        repos = stats['repos']
+        license_key = repos['license']
+        releases = repos['releases']
+        packages = repos['packages']
+        disk_mb = _fmt_num(repos['disk_usage'] / 1024)
+        total_stars = repos['total_stars']
+        total_forks = repos['total_forks']
+        total_watchers = repos['total_watchers']
+        summary = stats['summary']
+        
         # Get config
         cfg = self.config
         profile_cfg = cfg.get('profile', {})
@@ -275,467 +476,158 @@ class GitHubStatsGenerator:
         repos_cfg = cfg.get('repository_stats', {})
         metadata_cfg = cfg.get('metadata', {})
         
-        # Generate SVG content
-        svg_content = f"""<svg width="900" height="450" xmlns="http://www.w3.org/2000/svg">
-  <defs>
-
-    <g id="calendar-icon">
-      <rect x="0" y="1.5" width="10.5" height="9" rx="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="2.25" y1="0" x2="2.25" y2="3" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="8.25" y1="0" x2="8.25" y2="3" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="0" y1="4.5" x2="10.5" y2="4.5" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="users-icon">
-      <circle cx="3.75" cy="3" r="2.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M0,10.5 Q0,7.5 3.75,7.5 Q7.5,7.5 7.5,10.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="8.25" cy="3.75" r="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M7.5,10.5 Q7.5,8.25 9.75,8.25 Q12,8.25 12,10.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="briefcase-icon">
-      <rect x="0.75" y="3.75" width="10.5" height="6.75" rx="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M3.75,3.75 L3.75,2.25 Q3.75,1.5 4.5,1.5 L7.5,1.5 Q8.25,1.5 8.25,2.25 L8.25,3.75" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="activity-icon">
-      <polyline points="0,6 3,6 4.5,1.5 7.5,10.5 9,6 12,6" fill="none" stroke="#c9d1d9" stroke-width="1.5"/>
-    </g>
-    <g id="zap-icon">
-      <polygon points="6,0 1.5,6.75 6,6.75 4.5,12 10.5,5.25 6,5.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="building-icon">
-      <rect x="1.5" y="1.5" width="9" height="9" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <rect x="3.75" y="3.75" width="1.5" height="1.5" fill="#c9d1d9"/>
-      <rect x="6.75" y="3.75" width="1.5" height="1.5" fill="#c9d1d9"/>
-      <rect x="3.75" y="6.75" width="1.5" height="1.5" fill="#c9d1d9"/>
-      <rect x="6.75" y="6.75" width="1.5" height="1.5" fill="#c9d1d9"/>
-    </g>
-    <g id="folder-icon">
-      <path d="M1.5,2.25 L4.5,2.25 L6,3.75 L10.5,3.75 L10.5,9.75 L1.5,9.75 Z" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="star-icon">
-      <polygon points="6,0.75 7.5,4.5 11.25,4.5 8.25,6.75 9.75,10.5 6,8.25 2.25,10.5 3.75,6.75 0.75,4.5 4.5,4.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="git-commit-icon">
-      <circle cx="6" cy="6" r="2.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="0" y1="6" x2="3.75" y2="6" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="8.25" y1="6" x2="12" y2="6" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="eye-icon">
-      <ellipse cx="6" cy="6" rx="5.25" ry="3" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="6" cy="6" r="1.5" fill="#c9d1d9"/>
-    </g>
-    <g id="git-pr-icon">
-      <circle cx="2.25" cy="2.25" r="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="2.25" cy="9.75" r="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="9.75" cy="6" r="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="2.25" y1="3.75" x2="2.25" y2="8.25" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M8.25,6 L6,6 L6,2.25 L2.25,2.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="alert-icon">
-      <circle cx="6" cy="6" r="5.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="6" y1="3" x2="6" y2="6.75" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="6" cy="9" r="0.375" fill="#c9d1d9"/>
-    </g>
-    <g id="message-icon">
-      <rect x="0.75" y="2.25" width="10.5" height="7.5" rx="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <polyline points="0.75,2.25 6,6 11.25,2.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="user-plus-icon">
-      <circle cx="4.5" cy="3.75" r="2.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M0,10.5 Q0,7.5 4.5,7.5 Q9,7.5 9,10.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="9.75" y1="3.75" x2="12" y2="3.75" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="10.875" y1="2.625" x2="10.875" y2="4.875" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="star-outline-icon">
-      <polygon points="6,0.75 7.5,4.5 11.25,4.5 8.25,6.75 9.75,10.5 6,8.25 2.25,10.5 3.75,6.75 0.75,4.5 4.5,4.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="scale-icon">
-      <line x1="6" y1="1.5" x2="6" y2="10.5" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M1.5,4.5 L6,1.5 L10.5,4.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M1.5,4.5 L1.5,6 L4.5,6 L4.5,4.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M7.5,4.5 L7.5,6 L10.5,6 L10.5,4.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="rocket-icon">
-      <path d="M6,1.5 Q9,1.5 10.5,4.5 L10.5,7.5 L9,9 L7.5,7.5 L4.5,7.5 L3,9 L1.5,7.5 L1.5,4.5 Q3,1.5 6,1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="6.75" cy="4.5" r="0.75" fill="#c9d1d9"/>
-      <path d="M4.5,7.5 L3,10.5 L4.5,9" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M7.5,7.5 L9,10.5 L7.5,9" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="package-icon">
-      <path d="M1.5,3 L6,0.75 L10.5,3 L10.5,9 L6,11.25 L1.5,9 Z" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <polyline points="1.5,3 6,5.25 10.5,3" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <line x1="6" y1="5.25" x2="6" y2="11.25" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="database-icon">
-      <ellipse cx="6" cy="2.25" rx="4.5" ry="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M1.5,2.25 L1.5,9.75 Q1.5,11.25 6,11.25 Q10.5,11.25 10.5,9.75 L10.5,2.25" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <ellipse cx="6" cy="6" rx="4.5" ry="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-    <g id="fork-icon">
-      <circle cx="6" cy="1.5" r="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="2.25" cy="10.5" r="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <circle cx="9.75" cy="10.5" r="1.5" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-      <path d="M6,3 L6,6 M3.75,6 Q3.75,7.5 2.25,9 M8.25,6 Q8.25,7.5 9.75,9" fill="none" stroke="#c9d1d9" stroke-width="1"/>
-    </g>
-  </defs>
-  
-  <rect width="900" height="450" fill="#0d1117"/>
-  
-"""
-        
-        # Profile name
-        if profile_cfg.get('name', True):
-            svg_content += f"""
-  <text x="20" y="40" font-family="Arial" font-size="24" font-weight="bold" fill="#c9d1d9">{name}</text>"""
-        
-        # Profile details
-        y_pos = 58
-        if profile_cfg.get('joined_date', True):
-            svg_content += f"""
-  
-  <use href="#calendar-icon" x="20" y="{y_pos}"/>
-  <text x="42" y="{y_pos + 12}" font-family="Arial" font-size="14" fill="#c9d1d9">Joined: {created_at}</text>"""
-            y_pos += 25
-        
-        if profile_cfg.get('followers', True):
-            svg_content += f"""
-  
-  <use href="#users-icon" x="20" y="{y_pos}"/>
-  <text x="42" y="{y_pos + 12}" font-family="Arial" font-size="14" fill="#c9d1d9">Followers: {followers}</text>"""
-            y_pos += 25
-        
-        if profile_cfg.get('available_for_hire', True):
-            svg_content += f"""
-  
-  <use href="#briefcase-icon" x="20" y="{y_pos}"/>
-  <text x="42" y="{y_pos + 12}" font-family="Arial" font-size="14" fill="#c9d1d9">Available for hire: {"Yes" if hireable else "No"}</text>"""
-        
-        # Calendar section
-        if calendar_cfg.get('enabled', True):
-            svg_content += """
-  
-
-  <text x="550" y="40" font-family="Arial" font-size="18" font-weight="bold" fill="#c9d1d9">Last 7 Days</text>
-"""
-        
-        # Add contribution calendar
-        if calendar_cfg.get('enabled', True):
-            today = datetime.now(timezone.utc)
-            x_start = 550
-            y_start = 60
-            
-            for i in range(6, -1, -1):
-                date = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-                day_name = (today - timedelta(days=i)).strftime("%a")
-                count = stats.get('daily_contributions', {}).get(date, 0)
-                
-                if count == 0:
-                    color = "#ebedf0"
-                elif count <= 3:
-                    color = "#9be9a8"
-                elif count <= 6:
-                    color = "#40c463"
-                elif count <= 9:
-                    color = "#30a14e"
-                else:
-                    color = "#216e39"
-                
-                x_pos = x_start + (6 - i) * 45
-                svg_content += f'  <rect x="{x_pos}" y="{y_start}" width="35" height="35" fill="{color}" rx="3"/>\n'
-                svg_content += f'  <text x="{x_pos + 17}" y="{y_start + 55}" font-family="Arial" font-size="10" fill="#8b949e" text-anchor="middle">{day_name}</text>\n'
-        
-        svg_content += f"""
-  <text x="700" y="130" font-family="Arial" font-size="12" fill="#8b949e" text-anchor="middle">{stats['summary']}</text>
-  
-"""
-        
-        # Check if any activity stats are enabled
-        has_activity = any([
-            activity_cfg.get('commits', True),
-            activity_cfg.get('pr_reviews', True),
-            activity_cfg.get('prs_opened', True),
-            activity_cfg.get('issues_open', True),
-            activity_cfg.get('issue_comments', True)
-        ])
-        
-        # Check if any community stats are enabled
-        has_community = any([
-            community_cfg.get('organizations', True),
-            community_cfg.get('following', True),
-            community_cfg.get('starred', True),
-            community_cfg.get('watching', True)
-        ])
-        
-        # Check if any repository stats are enabled
-        has_repos = any([
-            repos_cfg.get('total_repos', True),
-            repos_cfg.get('license', True),
-            repos_cfg.get('releases', True),
-            repos_cfg.get('packages', True),
-            repos_cfg.get('disk_usage', True)
-        ])
-        
-        # Check if any metadata stats are enabled
-        has_metadata = any([
-            metadata_cfg.get('stargazers', True),
-            metadata_cfg.get('forkers', True),
-            metadata_cfg.get('watchers', True)
-        ])
-        
-        # Add headers only if section has enabled stats
-        if has_activity:
-            svg_content += """
-  <text x="20" y="190" font-family="Arial" font-size="16" font-weight="bold" fill="#c9d1d9">Activity Stats</text>"""
-        
-        if has_community:
-            svg_content += """
-  
-  <text x="240" y="190" font-family="Arial" font-size="16" font-weight="bold" fill="#c9d1d9">Community Stats</text>"""
-        
-        if has_repos:
-            svg_content += """
-  
-  <text x="460" y="190" font-family="Arial" font-size="16" font-weight="bold" fill="#c9d1d9">Repository Stats</text>"""
-        
-        if has_metadata:
-            svg_content += """
-  
-  <text x="680" y="190" font-family="Arial" font-size="16" font-weight="bold" fill="#c9d1d9">Metadata</text>"""
-        
-        svg_content += """
-  
-"""
-        
-        # Activity stats
-        y_pos = 210
-        if activity_cfg.get('commits', True):
-            svg_content += f"""
-  <use href="#git-commit-icon" x="20" y="{y_pos}"/>
-  <text x="38" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Commits (7d): {stats['activity']['commits']}</text>"""
-            y_pos += 25
-        
-        if activity_cfg.get('pr_reviews', True):
-            svg_content += f"""
-  
-  <use href="#eye-icon" x="20" y="{y_pos}"/>
-  <text x="38" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">PR Reviews: {stats['activity']['pr_reviews']}</text>"""
-            y_pos += 25
-        
-        if activity_cfg.get('prs_opened', True):
-            svg_content += f"""
-  
-  <use href="#git-pr-icon" x="20" y="{y_pos}"/>
-  <text x="38" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">PRs Opened: {stats['activity']['prs_opened']}</text>"""
-            y_pos += 25
-        
-        if activity_cfg.get('issues_open', True):
-            svg_content += f"""
-  
-  <use href="#alert-icon" x="20" y="{y_pos}"/>
-  <text x="38" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Issues Open: {stats['issues']['open']}</text>"""
-            y_pos += 25
-        
-        if activity_cfg.get('issue_comments', True):
-            svg_content += f"""
-  
-  <use href="#message-icon" x="20" y="{y_pos}"/>
-  <text x="38" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Issue Comments: {stats['issues']['comments']}</text>"""
+        # Resolve each toggle once
+        show_name = profile_cfg.get('name', True)
+        show_joined_date = profile_cfg.get('joined_date', True)
+        show_followers = profile_cfg.get('followers', True)
+        show_hireable = profile_cfg.get('available_for_hire', True)
         
-        svg_content += """
-  
-"""
+        show_calendar = calendar_cfg.get('enabled', True)
         
-        # Community stats
-        y_pos = 210
-        if community_cfg.get('organizations', True):
-            svg_content += f"""
-  <use href="#building-icon" x="240" y="{y_pos}"/>
-  <text x="258" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Organizations: {stats['community']['orgs']}</text>"""
-            y_pos += 25
-        
-        if community_cfg.get('following', True):
-            svg_content += f"""
-  
-  <use href="#user-plus-icon" x="240" y="{y_pos}"/>
-  <text x="258" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Following: {following}</text>"""
-            y_pos += 25
-        
-        if community_cfg.get('starred', True):
-            svg_content += f"""
-  
-  <use href="#star-outline-icon" x="240" y="{y_pos}"/>
-  <text x="258" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Starred: {stats['community']['starred']}</text>"""
-            y_pos += 25
+        show_commits = activity_cfg.get('commits', True)
+        show_pr_reviews = activity_cfg.get('pr_reviews', True)
+        show_prs_opened = activity_cfg.get('prs_opened', True)
+        show_issues_open = activity_cfg.get('issues_open', True)
+        show_issue_comments = activity_cfg.get('issue_comments', True)
         
-        if community_cfg.get('watching', True):
-            svg_content += f"""
-  
-  <use href="#eye-icon" x="240" y="{y_pos}"/>
-  <text x="258" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Watching: {stats['community']['watching']}</text>"""
+        show_orgs = community_cfg.get('organizations', True)
+        show_following = community_cfg.get('following', True)
+        show_starred = community_cfg.get('starred', True)
+        show_watching = community_cfg.get('watching', True)
         
-        svg_content += """
-  
-"""
+        show_total_repos = repos_cfg.get('total_repos', True)
+        show_license = repos_cfg.get('license', True)
+        show_releases = repos_cfg.get('releases', True)
+        show_packages = repos_cfg.get('packages', True)
+        show_disk_usage = repos_cfg.get('disk_usage', True)
         
-        # Repository stats
-        y_pos = 210
-        if repos_cfg.get('total_repos', True):
-            svg_content += f"""
-  <use href="#folder-icon" x="460" y="{y_pos}"/>
-  <text x="478" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Total Repos: {public_repos}</text>"""
-            y_pos += 25
+        show_stargazers = metadata_cfg.get('stargazers', True)
+        show_forkers = metadata_cfg.get('forkers', True)
+        show_watchers = metadata_cfg.get('watchers', True)
         
-        if repos_cfg.get('license', True):
-            svg_content += f"""
-  
-  <use href="#scale-icon" x="460" y="{y_pos}"/>
-  <text x="478" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">License: {stats['repos']['license']}</text>"""
-            y_pos += 25
+        has_activity = show_commits or show_pr_reviews or show_prs_opened or show_issues_open or show_issue_comments
+        has_community = show_orgs or show_following or show_starred or show_watching
+        has_repos = show_total_repos or show_license or show_releases or show_packages or show_disk_usage
+        has_metadata = show_stargazers or show_forkers or show_watchers
         
-        if repos_cfg.get('releases', True):
-            svg_content += f"""
-  
-  <use href="#rocket-icon" x="460" y="{y_pos}"/>
-  <text x="478" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Releases: {stats['repos']['releases']}</text>"""
-            y_pos += 25
+        # Generate SVG content
+        parts = [SVG_OPEN, _svg_defs(), SVG_BACKGROUND]
         
-        if repos_cfg.get('packages', True):
-            svg_content += f"""
-  
-  <use href="#package-icon" x="460" y="{y_pos}"/>
-  <text x="478" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Packages: {stats['repos']['packages']}</text>"""
-            y_pos += 25
+        # Profile name
+        if show_name:
+            parts.append(f"""
+  <text x="20" y="40" font-family="Arial" font-size="24" font-weight="bold" fill="#c9d1d9">{name}</text>""")
         
-        if repos_cfg.get('disk_usage', True):
-            svg_content += f"""
-  
-  <use href="#database-icon" x="460" y="{y_pos}"/>
-  <text x="478" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Disk: {stats['repos']['disk_usage'] / 1024:.2f} MB</text>"""
+        # Profile details, stacked 25px apart like the stat rows
+        detail_rows = []
+        y_pos = 58
+        for show, icon, label, value in (
+            (show_joined_date, "calendar-icon", "Joined", created_at),
+            (show_followers, "users-icon", "Followers", followers),
+            (show_hireable, "briefcase-icon", "Available for hire", "Yes" if hireable else "No")
+        ):
+            if show:
+                detail_rows.append(PROFILE_ROW_TMPL.format(icon=icon, y=y_pos, text_y=y_pos + 12, label=label, value=value))
+                y_pos += 25
+        if detail_rows:
+            parts.append(PROFILE_GROUP_OPEN)
+            parts.extend(detail_rows)
+            parts.append(ROW_GROUP_CLOSE)
         
-        svg_content += """
+        # Calendar section
+        if show_calendar:
+            parts.append("""
   
-"""
-        
-        # Metadata
-        y_pos = 210
-        if metadata_cfg.get('stargazers', True):
-            svg_content += f"""
-  <use href="#star-icon" x="680" y="{y_pos}"/>
-  <text x="698" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Stargazers: {stats['repos']['total_stars']}</text>"""
-            y_pos += 25
+
+  <text x="550" y="40" font-family="Arial" font-size="18" font-weight="bold" fill="#c9d1d9">Last 7 Days</text>
+""")
+        
+        # Add contribution calendar, one cell per day 45px apart from x=550
+        if show_calendar:
+            days = zip(stats['calendar_days'], stats['daily_contributions'])
+            parts.extend(
+                CELL_TMPL.format(x=550 + offset * 45, text_x=567 + offset * 45, color=COLORS[min(4, (count + 2) // 3)], day=day_name)
+                for offset, ((_, day_name), count) in enumerate(days)
+            )
         
-        if metadata_cfg.get('forkers', True):
-            svg_content += f"""
+        parts.append(f"""
+  <text x="700" y="130" font-family="Arial" font-size="12" fill="#8b949e" text-anchor="middle">{summary}</text>
   
-  <use href="#fork-icon" x="680" y="{y_pos}"/>
-  <text x="698" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Forkers: {stats['repos']['total_forks']}</text>"""
-            y_pos += 25
+""")
         
-        if metadata_cfg.get('watchers', True):
-            svg_content += f"""
+        # Add headers only if section has enabled stats
+        for has_stats, x, title in (
+            (has_activity, 20, "Activity Stats"),
+            (has_community, 240, "Community Stats"),
+            (has_repos, 460, "Repository Stats"),
+            (has_metadata, 680, "Metadata")
+        ):
+            if has_stats:
+                parts.append(HEADER_TMPL.format(x=x, title=title))
+        
+        parts.append("""
   
-  <use href="#eye-icon" x="680" y="{y_pos}"/>
-  <text x="698" y="{y_pos + 10}" font-family="Arial" font-size="13" fill="#c9d1d9">Watchers: {stats['repos']['total_watchers']}</text>"""
-        
-        svg_content += """
-</svg>"""
-        
-        return svg_content
-        """Generate comprehensive profile section"""
-        name = profile.get("name", self.username)
-        hireable = profile.get("hireable", False)
-        created_at = datetime.strptime(profile["created_at"], "%Y-%m-%dT%H:%M:%SZ").strftime("%B %d, %Y")
-        followers = profile.get("followers", 0)
-        following = profile.get("following", 0)
-        public_repos = profile.get("public_repos", 0)
-        
-        section = f"""<table width="100%" cellspacing="0" cellpadding="0" style="border: 0; border-collapse: collapse; background-color: #0d1117;">
-<tr>
-<td valign="top" width="60%" style="border: 0; padding: 20px; color: #c9d1d9;">
-
-### <span style="color: #58a6ff;">{name}</span>
-
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/calendar.svg" width="16" height="16" style="filter: invert(1);" /> **Joined:** {created_at}  
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/users.svg" width="16" height="16" style="filter: invert(1);" /> **Followers:** {followers}  
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/briefcase.svg" width="16" height="16" style="filter: invert(1);" /> **Available for hire:** {"Yes" if hireable else "No"}
-
-</td>
-<td valign="top" width="360" style="border: 0; padding: 20px; color: #c9d1d9;">
-
-### <img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/activity.svg" width="20" height="20" style="filter: invert(1);" /> Last 7 Days
-
-{stats['calendar']}
-
-<p align="center"><em>{stats['summary']}</em></p>
-
-</td>
-</tr>
-</table>
-
-<table width="100%" cellspacing="0" cellpadding="0" style="border: 0; border-collapse: collapse; background-color: #0d1117;">
-<tr>
-<th width="25%" style="border: 0; padding: 15px; color: #58a6ff; text-align: left;"><img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/zap.svg" width="16" height="16" style="filter: invert(1);" /> Activity Stats</th>
-<th width="25%" style="border: 0; padding: 15px; color: #58a6ff; text-align: left;"><img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/users.svg" width="16" height="16" style="filter: invert(1);" /> Community Stats</th>
-<th width="25%" style="border: 0; padding: 15px; color: #58a6ff; text-align: left;"><img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/folder.svg" width="16" height="16" style="filter: invert(1);" /> Repository Stats</th>
-<th width="25%" style="border: 0; padding: 15px; color: #58a6ff; text-align: left;"><img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/award.svg" width="16" height="16" style="filter: invert(1);" /> Metadata</th>
-</tr>
-<tr>
-<td valign="top" style="border: 0; padding: 15px; color: #c9d1d9;">
-
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/git-commit.svg" width="14" height="14" style="filter: invert(1);" /> **Commits (7d):** {stats['activity']['commits']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/eye.svg" width="14" height="14" style="filter: invert(1);" /> **PR Reviews:** {stats['activity']['pr_reviews']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/git-pull-request.svg" width="14" height="14" style="filter: invert(1);" /> **PRs Opened:** {stats['activity']['prs_opened']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/alert-circle.svg" width="14" height="14" style="filter: invert(1);" /> **Issues Open:** {stats['issues']['open']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/message-circle.svg" width="14" height="14" style="filter: invert(1);" /> **Issue Comments:** {stats['issues']['comments']}
-
-</td>
-<td valign="top" style="border: 0; padding: 15px; color: #c9d1d9;">
-
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/building.svg" width="14" height="14" style="filter: invert(1);" /> **Organizations:** {stats['community']['orgs']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/user-plus.svg" width="14" height="14" style="filter: invert(1);" /> **Following:** {following}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/star.svg" width="14" height="14" style="filter: invert(1);" /> **Starred:** {stats['community']['starred']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/eye.svg" width="14" height="14" style="filter: invert(1);" /> **Watching:** {stats['community']['watching']}
-
-</td>
-<td valign="top" style="border: 0; padding: 15px; color: #c9d1d9;">
-
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/folder-git.svg" width="14" height="14" style="filter: invert(1);" /> **Total Repos:** {public_repos}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/scale.svg" width="14" height="14" style="filter: invert(1);" /> **License:** {stats['repos']['license']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/rocket.svg" width="14" height="14" style="filter: invert(1);" /> **Releases:** {stats['repos']['releases']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/package.svg" width="14" height="14" style="filter: invert(1);" /> **Packages:** {stats['repos']['packages']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/hard-drive.svg" width="14" height="14" style="filter: invert(1);" /> **Disk:** {stats['repos']['disk_usage'] / 1024:.2f} MB
-
-</td>
-<td valign="top" style="border: 0; padding: 15px; color: #c9d1d9;">
-
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/star.svg" width="14" height="14" style="filter: invert(1);" /> **Stargazers:** {stats['repos']['total_stars']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/git-fork.svg" width="14" height="14" style="filter: invert(1);" /> **Forkers:** {stats['repos']['total_forks']}<br>
-<img src="https://cdn.jsdelivr.net/npm/lucide-static@latest/icons/eye.svg" width="14" height="14" style="filter: invert(1);" /> **Watchers:** {stats['repos']['total_watchers']}
-
-</td>
-</tr>
-</table>
-"""
-        return section
+""")
+        
+        # Stat columns
+        parts.append(_stat_rows(20, (
+            (show_commits, "commits", "Commits (7d)", commits),
+            (show_pr_reviews, "pr_reviews", "PR Reviews", pr_reviews),
+            (show_prs_opened, "prs_opened", "PRs Opened", prs_opened),
+            (show_issues_open, "issues_open", "Issues Open", open_issues),
+            (show_issue_comments, "issue_comments", "Issue Comments", issue_comments)
+        )))
+        parts.append(COLUMN_BREAK)
+        parts.append(_stat_rows(240, (
+            (show_orgs, "organizations", "Organizations", orgs),
+            (show_following, "following", "Following", following),
+            (show_starred, "starred", "Starred", starred),
+            (show_watching, "watching", "Watching", watching)
+        )))
+        parts.append(COLUMN_BREAK)
+        parts.append(_stat_rows(460, (
+            (show_total_repos, "total_repos", "Total Repos", public_repos),
+            (show_license, "license", "License", license_key),
+            (show_releases, "releases", "Releases", releases),
+            (show_packages, "packages", "Packages", packages),
+            (show_disk_usage, "disk_usage", "Disk", f"{disk_mb} MB")
+        )))
+        parts.append(COLUMN_BREAK)
+        parts.append(_stat_rows(680, (
+            (show_stargazers, "stargazers", "Stargazers", total_stars),
+            (show_forkers, "forkers", "Forkers", total_forks),
+            (show_watchers, "watchers", "Watchers", total_watchers)
+        )))
+        
+        parts.append("""
+</svg>""")
+        
+        return "".join(parts)
     
     def generate_stats(self, sections: List[str]) -> str:
         # Generate stats
         print(f"Fetching stats for {self.username}...")
         
-        profile = self.get_user_profile()
-        repos = self.get_user_repos()
-        events = self.get_user_events(7)
-        orgs = self.get_organizations()
+        # The 7 calendar days, computed once for the query window and the calendar
+        calendar_days = _last_7_days(datetime.now(timezone.utc))
+        # Whole days so the query, and its cache key, stay the same all day
+        start = datetime.fromisoformat(calendar_days[0][0]).replace(tzinfo=timezone.utc)
+        viewer = self.get_viewer_stats(start, start + timedelta(days=7))
+        
+        profile = {
+            "name": viewer["name"],
+            "hireable": viewer["isHireable"],
+            "created_at": viewer["createdAt"],
+            "followers": viewer["followers"]["totalCount"],
+            "following": viewer["following"]["totalCount"],
+            "public_repos": viewer["publicRepos"]["totalCount"]
+        }
         
         print("Analyzing repositories...")
-        repo_stats = self.analyze_repos(repos)
+        repo_stats = self.analyze_repos(viewer["repositories"])
         
         print("Analyzing activity...")
-        activity_stats = self.analyze_events(events)
-        
-        print("Fetching community stats...")
-        starred = self.get_starred_count()
-        watching = self.get_watching_count()
-        open_issues, issue_comments = self.get_issues_stats()
+        activity_stats = self.analyze_contributions(viewer["contributionsCollection"], [date for date, _ in calendar_days])
         
         stats = {
             'activity': {
@@ -744,15 +636,16 @@ class GitHubStatsGenerator:
                 'prs_opened': activity_stats['prs_opened']
             },
             'issues': {
-                'open': open_issues,
-                'comments': issue_comments
+                'open': viewer["issues"]["totalCount"],
+                'comments': viewer["commented"]["issueCount"]
             },
             'community': {
-                'orgs': len(orgs),
-                'starred': starred,
-                'watching': watching
+                'orgs': viewer["organizations"]["totalCount"],
+                'starred': viewer["starredRepositories"]["totalCount"],
+                'watching': viewer["watching"]["totalCount"]
             },
             'repos': repo_stats,
+            'calendar_days': calendar_days,
             'daily_contributions': activity_stats['daily_contributions'],
             'summary': self.generate_contribution_summary(activity_stats['daily_contributions'])
         }
@@ -764,20 +657,33 @@ class GitHubStatsGenerator:
     def update_readme(self, readme_path: str, svg_content: str):
         """Update README and SVG files"""
         svg_path = "github-stats.svg"
-        
-        # Check if SVG content changed
-        svg_changed = True
-        if os.path.exists(svg_path):
-            with open(svg_path, "r") as f:
-                old_svg = f.read()
-            if old_svg == svg_content:
-                svg_changed = False
-                print("SVG unchanged, skipping update")
-        
-        if svg_changed:
-            # Write SVG file
-            with open(svg_path, "w") as f:
-                f.write(svg_content)
+        hash_path = os.path.join(self.cache_dir, "github-stats.svg.blake2b")
+        
+        # Encoded once, the same bytes are hashed and written
+        svg_bytes = svg_content.encode()
+        
+        # The sidecar holds the digest plus the size and mtime the SVG had when written,
+        # so an SVG replaced on disk since (checkout, pull, manual edit) is never mistaken for ours
+        new_hash = hashlib.blake2b(svg_bytes, digest_size=16).hexdigest()
+        svg_unchanged = False
+        if os.path.exists(svg_path) and os.path.exists(hash_path):
+            with open(hash_path, "r") as f:
+                old_hash, _, old_stamp = f.read().partition(" ")
+            svg_stat = os.stat(svg_path)
+            svg_unchanged = old_hash == new_hash and old_stamp == f"{svg_stat.st_size} {svg_stat.st_mtime_ns}"
+        
+        if svg_unchanged:
+            print("SVG unchanged, skipping update")
+        else:
+            # Write SVG file, then its digest and stamp, each swapped in atomically
+            with open(svg_path + ".tmp", "wb") as f:
+                f.write(svg_bytes)
+            os.replace(svg_path + ".tmp", svg_path)
+            svg_stat = os.stat(svg_path)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(hash_path + ".tmp", "w") as f:
+                f.write(f"{new_hash} {svg_stat.st_size} {svg_stat.st_mtime_ns}")
+            os.replace(hash_path + ".tmp", hash_path)
             print(f"Updated {svg_path}")
         
         # Create or check README